@@ -2,12 +2,14 @@
 """
 ML Model Prediction Script
 Called from Next.js API routes via child process
-Accepts JSON input via stdin, outputs JSON to stdout
+Runs as a long-lived worker: the model is loaded once, then each
+newline-delimited JSON request on stdin gets one JSON line on stdout
 """
 
 import sys
 import json
 import pickle
+import select
 import numpy as np
 import os
 from pathlib import Path
@@ -22,91 +24,177 @@ FEATURE_COLUMNS = [
     'Oil Refill Start', 'Oil Top-up', 'Health_Score_Lag_1'
 ]
 
+# Request coalescing: wait up to BATCH_WINDOW seconds for more requests
+# and send at most MAX_BATCH_SIZE of them to model.predict at once
+BATCH_WINDOW = 0.002
+MAX_BATCH_SIZE = 32
+
 def load_model():
     """Load the trained ML model"""
     try:
         with open(MODEL_PATH, 'rb') as f:
             model = pickle.load(f)
         return model
-    except Exception as e:
-        return None, str(e)
+    except Exception:
+        # handle_requests answers every request with "Failed to load ML model"
+        return None
+
+def extract_features(input_data):
+    """Extract the model features from a request in the correct order"""
+    return [
+        input_data['oil_hrs'],
+        input_data['total_hrs'],
+        input_data['viscosity_40'],
+        input_data['oil_refill_start'],
+        input_data['oil_topup'],
+        input_data['health_score_lag_1']
+    ]
+
+def build_result(input_data, raw_prediction):
+    """Build the response for a single prediction"""
+    # Ensure prediction is in valid range
+    raw_prediction = float(np.clip(raw_prediction, 0.0, 1.0))
+
+    # Determine confidence
+    confidence = "high"
+    if input_data['health_score_lag_1'] == 0:
+        confidence = "medium"
+
+    return {
+        "success": True,
+        "raw_health_score": raw_prediction,
+        "confidence": confidence,
+        "model_version": "XGBoost_v1.0",
+        "features_used": FEATURE_COLUMNS
+    }
+
+def predict_batch(model, input_batch):
+    """Make predictions for several requests with a single model.predict call"""
+    results = [None] * len(input_batch)
+    rows = []
+    row_positions = []
+
+    for i, input_data in enumerate(input_batch):
+        try:
+            # Convert each row on its own so a bad value only fails its own request
+            rows.append(np.asarray(extract_features(input_data), dtype=np.float32))
+            row_positions.append(i)
+        except Exception as e:
+            results[i] = {
+                "success": False,
+                "error": str(e)
+            }
+
+    if rows:
+        try:
+            features = np.stack(rows)
+            predictions = model.predict(features)
+            for i, raw_prediction in zip(row_positions, predictions):
+                results[i] = build_result(input_batch[i], raw_prediction)
+        except Exception as e:
+            for i in row_positions:
+                results[i] = {
+                    "success": False,
+                    "error": str(e)
+                }
+
+    return results
 
 def predict(model, input_data):
     """Make prediction using the model"""
-    try:
-        # Extract features in correct order
-        features = np.array([[
-            input_data['oil_hrs'],
-            input_data['total_hrs'],
-            input_data['viscosity_40'],
-            input_data['oil_refill_start'],
-            input_data['oil_topup'],
-            input_data['health_score_lag_1']
-        ]])
-
-        # Make prediction
-        raw_prediction = model.predict(features)[0]
-
-        # Ensure prediction is in valid range
-        raw_prediction = float(np.clip(raw_prediction, 0.0, 1.0))
-
-        # Determine confidence
-        confidence = "high"
-        if input_data['health_score_lag_1'] == 0:
-            confidence = "medium"
-
-        return {
-            "success": True,
-            "raw_health_score": raw_prediction,
-            "confidence": confidence,
-            "model_version": "XGBoost_v1.0",
-            "features_used": FEATURE_COLUMNS
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "error": str(e)
-        }
+    return predict_batch(model, [input_data])[0]
 
-def main():
-    """Main function - reads from stdin, writes to stdout"""
-    try:
-        # Read JSON input from stdin
-        input_line = sys.stdin.read()
-        input_data = json.loads(input_line)
+def handle_requests(model, input_lines):
+    """Handle a batch of JSON request lines and return one result per line"""
+    results = [None] * len(input_lines)
+    requests = []
+    request_positions = []
+
+    for i, input_line in enumerate(input_lines):
+        try:
+            input_data = json.loads(input_line)
+        except json.JSONDecodeError as e:
+            results[i] = {
+                "success": False,
+                "error": f"Invalid JSON input: {str(e)}"
+            }
+            continue
 
-        # Load model
-        model = load_model()
         if model is None:
-            result = {
+            results[i] = {
                 "success": False,
                 "error": "Failed to load ML model"
             }
-        else:
-            # Make prediction
-            result = predict(model, input_data)
+            continue
 
-        # Write JSON output to stdout
-        print(json.dumps(result))
-        sys.stdout.flush()
+        requests.append(input_data)
+        request_positions.append(i)
 
-    except json.JSONDecodeError as e:
-        error_result = {
-            "success": False,
-            "error": f"Invalid JSON input: {str(e)}"
-        }
-        print(json.dumps(error_result))
-        sys.stdout.flush()
-        sys.exit(1)
-
-    except Exception as e:
-        error_result = {
-            "success": False,
-            "error": f"Prediction failed: {str(e)}"
-        }
-        print(json.dumps(error_result))
+    if requests:
+        try:
+            predictions = predict_batch(model, requests)
+        except Exception as e:
+            predictions = [{
+                "success": False,
+                "error": f"Prediction failed: {str(e)}"
+            }] * len(requests)
+
+        for i, input_data, result in zip(request_positions, requests, predictions):
+            # Echo the caller's request id so responses can be matched up
+            if isinstance(input_data, dict) and 'request_id' in input_data:
+                result = {**result, "request_id": input_data['request_id']}
+            results[i] = result
+
+    return results
+
+def read_batches(stream):
+    """Yield lists of request lines, coalescing requests that arrive together"""
+    fd = stream.fileno()
+    buffer = b""
+    eof = False
+
+    while not eof:
+        # Block until at least one complete line (or EOF) is available
+        while b"\n" not in buffer:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                eof = True
+                break
+            buffer += chunk
+
+        # Dispatch a lone request at once; only wait up to BATCH_WINDOW for
+        # more while further requests are already arriving
+        timeout = 0
+        while not eof and buffer.count(b"\n") < MAX_BATCH_SIZE:
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                break
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                eof = True
+                break
+            buffer += chunk
+            timeout = BATCH_WINDOW
+
+        *lines, buffer = buffer.split(b"\n")
+        if eof and buffer:
+            lines.append(buffer)
+            buffer = b""
+
+        lines = [line for line in lines if line.strip()]
+        for start in range(0, len(lines), MAX_BATCH_SIZE):
+            yield lines[start:start + MAX_BATCH_SIZE]
+
+def main():
+    """Main function - serves stdin requests until EOF, writes to stdout"""
+    # Load model once for the lifetime of the worker
+    model = load_model()
+
+    for input_lines in read_batches(sys.stdin):
+        # Write one JSON line per request, in order, and flush so the caller can read them
+        for result in handle_requests(model, input_lines):
+            print(json.dumps(result))
         sys.stdout.flush()
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -1,68 +1,240 @@
-import re
+import hashlib
 import json
+import mmap
 import os
+import re
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    # C-speed serializer; the stdlib fallback below writes identical output
+    import orjson
+except ImportError:
+    orjson = None
+
+# Control characters (like \x07 used by textutil for table cells), mapped to space
+CTRL_TABLE = {c: 0x20 for c in [*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20)]}
+
+# Split Sample IDs (e.g. "S/I- M123" or "S/I M123")
+SI_SPLIT_RE = re.compile(r'(?i)S/I(?:\s*-\s*|\s+)M')
+
+# A Sample ID is any whitespace-delimited token containing both "S/I" and "M";
+# a block is a run of consecutive Sample IDs separated only by whitespace
+SAMPLE_ID_PATTERN = r'\S*(?:S/I\S*M|M\S*S/I)\S*'
+SAMPLE_BLOCK_RE = re.compile(f"{SAMPLE_ID_PATTERN}(?:\\s+{SAMPLE_ID_PATTERN})*")
+
+# Section headings that say which machinery the following samples belong to
+CATEGORY_MARKER_RE = re.compile(r'(?i)\b(?:PORT|STBD|STARBOARD|NO(?:\.\s*|\s+)0[12])\b')
+
+# Pattern for DD Mon YY or DD Mon YYYY (e.g. 11 Jul 25, 11 Jul 2025)
+MONTHS = r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+DATE_RE = re.compile(r"(?i)\b(\d{1,2})\s+(" + MONTHS + r")\s+(\d{2,4})\b")
+MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
+    'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+DATE_DOT_RE = re.compile(r"\b(\d{1,2})\.(\d{1,2})\.(\d{2,4})\b")
+DATE_KW_RE = re.compile(r"(?i)(Date\s*(?:of\s+Sampling|sampling)?\s*[:\-]?)")
+
+# Pattern for a single value:
+# - Number (maybe with < prefix, maybe separated by space, maybe with * suffix, maybe with commas)
+# - Or N/A, N/C, etc.
+# We allow space between < and number: (?:(?:<|&lt;)\s*)?
+# Number: [\d,\.]+\*?
+VAL_PATTERN = r'(?:(?:<|&lt;)\s*)?[\d,\.]+\*?|N/A|N/C|N/I|-'
+VAL_RE = re.compile(VAL_PATTERN)
+
+# Regex for a sequence of values
+# We want to capture the whole sequence
+# The sequence starts after the keyword (and potential units/junk)
+# It consists of values separated by whitespace
+# We use \s+ to ensure separation, but the first value might be immediate
+SEQ_RE = re.compile(f"((?:\\s*(?:{VAL_PATTERN}))+)")
+
+# Row labels used in the reports for each record field, in lookup order
+FIELD_KEYWORDS = {
+    'oil_hrs': ['Oil Running Hrs', 'Oil Running Hours'],
+    'total_hrs': ['T/R/H of Machinery', 'Total Running Hours'],
+    'viscosity_40': ['Viscosity@ 40oC', 'Viscosity @ 40oC', 'Viscosity  @ 40oC', 'ViViscosity@ 40oC'],
+    'viscosity_100': ['Viscosity@ 100oC', 'Viscosity @ 100oC', 'Viscosity  @ 100oC'],
+    'viscosity_index': ['Viscosity Index'],
+    'tbn': ['Total Base No.', 'TB No.'],
+    'water_content': ['Water content'],
+    'flash_point': ['Flash Point'],
+    'fe_ppm': ['Fe', 'Iron'],
+    'cr_ppm': ['Cr', 'Chromium'],
+    'si_ppm': ['Si', 'Silicon'],
+    'al_ppm': ['Al', 'Aluminum'],
+    'pb_ppm': ['Pb', 'Lead'],
+    'cu_ppm': ['Cu', 'Copper'],
+    'sn_ppm': ['Sn', 'Tin'],
+    'ni_ppm': ['Ni', 'Nickel'],
+}
+
+# Every record starts from this template; the measured fields are filled in
+# per sample and created_at per file. Key order is the order written to JSON.
+RECORD_TEMPLATE = {
+    'sample_id': None,
+    **dict.fromkeys(FIELD_KEYWORDS),
+    'oil_refill_start': 0,
+    'oil_topup': 0,
+    'health_score_lag_1': 0.1,
+    'ml_raw_score': 0.1,
+    'gemini_final_score': 0.1,
+    'status': 'OPTIMAL_CONDITION',
+    'trend': 'STABLE',
+    'recommendation': 'Maintain current operations',
+    'confidence': 'historical',
+    'created_at': None
+}
+
+ALL_KEYWORDS = [keyword for keywords in FIELD_KEYWORDS.values() for keyword in keywords]
+
+def normalize_space(text):
+    """Collapse whitespace runs to single spaces"""
+    return " ".join(text.split())
+
+# Single alternation over every row label, so each file is scanned once.
+# No label occurs inside another one, so non-overlapping matches find every
+# occurrence of every label. Words may be separated by any whitespace
+# run, since the raw text is searched rather than a re-joined token list.
+KEYWORD_PATTERNS = {
+    r"\b" + r"\s+".join(re.escape(word) for word in keyword.split()) + r"\b"
+    for keyword in ALL_KEYWORDS
+}
+KEYWORD_SCAN_RE = re.compile("(?i)" + "|".join(sorted(KEYWORD_PATTERNS, key=len, reverse=True)))
 
+# Labels that only differ in spacing share a normalized form
+KEYWORDS_BY_TEXT = {}
+for keyword in ALL_KEYWORDS:
+    KEYWORDS_BY_TEXT.setdefault(normalize_space(keyword).lower(), []).append(keyword)
+
+def index_keywords(content):
+    """Map each row label to the (starts, ends) offsets of all its occurrences in content"""
+    index = {}
+    for match in KEYWORD_SCAN_RE.finditer(content):
+        for keyword in KEYWORDS_BY_TEXT.get(normalize_space(match.group(0)).lower(), ()):
+            starts, ends = index.setdefault(keyword, ([], []))
+            starts.append(match.start())
+            ends.append(match.end())
+    return index
+
+def find_keywords(keyword_index, pos):
+    """Map each row label to the end offset of its first occurrence at or after pos"""
+    hits = {}
+    for keyword, (starts, ends) in keyword_index.items():
+        i = bisect_left(starts, pos)
+        if i < len(starts):
+            hits[keyword] = ends[i]
+    return hits
+
+def extract_row(content, keyword_hits, keywords, count):
+    """Extract the last `count` values of the first labelled row found after a block"""
+    for keyword in keywords:
+        # Find keyword
+        kw_end = keyword_hits.get(keyword)
+        
+        if kw_end is not None:
+            # Find the first sequence of values after the keyword
+            # This will stop when it hits something that is NOT a value (like the next keyword)
+            seq_match = SEQ_RE.search(content, kw_end)
+            
+            if seq_match:
+                vals_str = seq_match.group(1)
+                # Extract individual values from the sequence string; values are
+                # normally whitespace-separated, so only fall back to the regex
+                # for runs like "< 1.00" or "12.5N/A"
+                vals = vals_str.split()
+                if not all(VAL_RE.fullmatch(v) for v in vals):
+                    vals = VAL_RE.findall(vals_str)
+                
+                # If we found enough values, take the last 'count' values
+                # (values like "<  1.00" keep single spacing)
+                if len(vals) >= count:
+                    return [normalize_space(v) for v in vals[-count:]]
+                
+    return [None] * count
+
+def marker_category(marker):
+    """Map a CATEGORY_MARKER_RE match to its record category"""
+    text = marker.group(0).upper()
+    if text == 'PORT':
+        return 'Port'
+    if text in ('STBD', 'STARBOARD'):
+        return 'Stbd'
+    return 'No1' if text.endswith('1') else 'No2'
+
+# Placeholders used in the reports for values that were not measured
+NA_VALUES = frozenset({'N/A', 'N/C', 'N/I', '-', ''})
+
+# Report values repeat heavily (N/A, < 1.00, 0, ...), so parse each distinct one once
+@lru_cache(maxsize=4096)
 def parse_value(val):
-    if not val:
-        return None
-    val = val.strip()
-    if val.upper() in ['N/A', 'N/C', 'N/I', '-', '']:
+    # Values are VAL_RE matches: already trimmed, and the N/A forms only
+    # match in upper case, so no strip()/upper() is needed
+    if not val or val in NA_VALUES:
         return None
     
     # Handle < 1.00
-    if val.startswith('<') or val.startswith('&lt;'):
+    if val.startswith(('<', '&lt;')):
         return 0.5 # Default for trace amounts
             
     try:
         # Remove commas
-        clean_val = val.replace(',', '')
-        return float(clean_val)
-    except:
+        return float(val.replace(',', ''))
+    except ValueError:
         return val
 
+def parse_date_str(day, month, year):
+    """Build a created_at timestamp from DATE_RE date parts"""
+    m = MONTH_MAP.get(month.lower()[:3], '01')
+    if len(year) == 2: year = "20" + year
+    return f"{year}-{m}-{day.zfill(2)} 10:00:00"
+
+def parse_hours(val):
+    """Parse a running-hours value, defaulting to 0.0 when missing or non-numeric"""
+    hours = parse_value(val)
+    return hours if isinstance(hours, float) else 0.0
+
+def read_text(filepath):
+    """Decode a text file straight from a memory map, without an intermediate bytes copy"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'utf-8', 'ignore')
+
 def parse_text_file(filepath):
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
+    content = read_text(filepath)
 
     # Replace control characters (like \x07 used by textutil for table cells) with space
-    content = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f]', ' ', content)
+    content = content.translate(CTRL_TABLE)
     
-    # Fix split Sample IDs (e.g. "S/I- M123" -> "S/I-M123")
-    content = re.sub(r'S/I\s*-\s*M', 'S/I-M', content, flags=re.IGNORECASE)
-    content = re.sub(r'S/I\s+M', 'S/I-M', content, flags=re.IGNORECASE)
-
-    # Helper to parse date parts
-    def parse_date_str(day, month, year):
-        month_map = {
-            'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-            'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-        }
-        m = month_map.get(month.lower()[:3], '01')
-        if len(year) == 2: year = "20" + year
-        return f"{year}-{m}-{day.zfill(2)} 10:00:00"
+    # Fix split Sample IDs (e.g. "S/I- M123" -> "S/I-M123") in one pass
+    content = SI_SPLIT_RE.sub('S/I-M', content)
 
     created_at_val = "2025-01-01 10:00:00"
-    header = content[:1000]
-    
-    # Pattern for DD Mon YY or DD Mon YYYY (e.g. 11 Jul 25, 11 Jul 2025)
-    months = r"Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
-    date_pattern = r"\b(\d{1,2})\s+(" + months + r")\s+(\d{2,4})\b"
+    # Offsets into the header count newlines the way text-mode reads did ("\r\n" -> "\n");
+    # everywhere else "\r" is just whitespace
+    header = content[:2000].replace('\r\n', '\n').replace('\r', '\n')[:1000]
     
     # 1. Look for "Date..." followed by date
-    date_keywords = re.search(r"(Date\s*(?:of\s+Sampling|sampling)?\s*[:\-]?)", header, re.IGNORECASE)
+    date_keywords = DATE_KW_RE.search(header)
     found = False
     if date_keywords:
         post_keyword = header[date_keywords.end():]
         # Match date pattern
-        match = re.search(date_pattern, post_keyword, re.IGNORECASE)
+        match = DATE_RE.search(post_keyword)
         if match:
             day, month, year = match.groups()
             created_at_val = parse_date_str(day, month, year)
             found = True
         else:
             # Try DD.MM.YYYY
-            match_dot = re.search(r"\b(\d{1,2})\.(\d{1,2})\.(\d{2,4})\b", post_keyword)
+            match_dot = DATE_DOT_RE.search(post_keyword)
             if match_dot:
                 day, month, year = match_dot.groups()
                 if len(year) == 2: year = "20" + year
@@ -71,7 +243,7 @@ def parse_text_file(filepath):
 
     # 2. If not found, look for any recent date (>= 2023) in header
     if not found:
-        matches = re.findall(date_pattern, header, re.IGNORECASE)
+        matches = DATE_RE.findall(header)
         for day, month, year in matches:
             y = year
             if len(y) == 2: y = "20" + y
@@ -80,158 +252,99 @@ def parse_text_file(filepath):
                 found = True
                 break
     
-    tokens = content.split()
-    
-    # Find all indices where a Sample ID starts
-    sample_indices = [i for i, t in enumerate(tokens) if 'S/I' in t and 'M' in t]
+    # Find all blocks of consecutive Sample IDs
+    blocks = list(SAMPLE_BLOCK_RE.finditer(content))
     
-    if not sample_indices:
+    if not blocks:
         print(f"No sample IDs found in {filepath}")
         return {}
 
-    # Group consecutive sample IDs into blocks
-    blocks = []
-    if sample_indices:
-        current_block = [sample_indices[0]]
-        for i in range(1, len(sample_indices)):
-            if sample_indices[i] == sample_indices[i-1] + 1:
-                current_block.append(sample_indices[i])
-            else:
-                blocks.append(current_block)
-                current_block = [sample_indices[i]]
-        blocks.append(current_block)
-
-    categorized_records = {} # key: category (e.g., 'Port', 'Stbd', 'Default'), value: list of records
-
-    for block_indices in blocks:
+    record_template = {**RECORD_TEMPLATE, 'created_at': created_at_val}
+
+    categorized_records = {} # key: category (e.g., 'Port', 'Stbd', 'Default'), value: {sample_id: record}
+
+    # Walk section markers and blocks forward together; each block belongs
+    # to the most recent marker before it
+    category = 'Default'
+    side_line_end = -1
+    markers = CATEGORY_MARKER_RE.finditer(content)
+    next_marker = next(markers, None)
+
+    # Locate every row label in one pass over the whole file
+    keyword_index = index_keywords(content)
+
+    for block in blocks:
         # Determine category for this block
-        # Look backwards from block start for keywords
-        block_start_idx = block_indices[0]
-        preceding_text = " ".join(tokens[max(0, block_start_idx-500):block_start_idx]).upper()
-        
-        category = 'Default'
-        if 'PORT' in preceding_text and 'STBD' not in preceding_text.split('PORT')[-1]:
-            category = 'Port'
-        elif 'STBD' in preceding_text or 'STARBOARD' in preceding_text:
-            category = 'Stbd'
-        elif 'NO 01' in preceding_text or 'NO.01' in preceding_text or 'NO. 01' in preceding_text:
-             category = 'No1'
-        elif 'NO 02' in preceding_text or 'NO.02' in preceding_text or 'NO. 02' in preceding_text:
-             category = 'No2'
+        while next_marker is not None and next_marker.start() < block.start():
+            marker = marker_category(next_marker)
+            if marker in ('Port', 'Stbd'):
+                category = marker
+                side_line_end = content.find('\n', next_marker.end())
+                if side_line_end == -1:
+                    side_line_end = len(content)
+            elif next_marker.start() > side_line_end:
+                # A NO 01/NO 02 on the same line as PORT/STBD ("Port Gear Box (No.02)")
+                # only qualifies the side, so it does not replace it
+                category = marker
+            next_marker = next(markers, None)
              
         if category not in categorized_records:
-            categorized_records[category] = []
+            categorized_records[category] = {}
 
         # Extract sample IDs
-        sample_ids = [tokens[i] for i in block_indices]
+        sample_ids = block.group(0).split()
         
-        # Find extraction window
-        search_text = " ".join(tokens[block_indices[-1]+1:])
+        # Find extraction window: from this block to EOF. The rows for a
+        # block can sit past later blocks (e.g. the TREND ANALYSIS table),
+        # so the window is not cut at the next block.
+        keyword_hits = find_keywords(keyword_index, block.end())
         
-        # Helper to extract a row of values
-        def extract_row(keywords, count):
-            # Pattern for a single value:
-            # - Number (maybe with < prefix, maybe separated by space, maybe with * suffix, maybe with commas)
-            # - Or N/A, N/C, etc.
-            # We allow space between < and number: (?:(?:<|&lt;)\s*)?
-            # Number: [\d,\.]+\*?
-            val_pattern = r'(?:(?:<|&lt;)\s*)?[\d,\.]+\*?|N/A|N/C|N/I|-'
-            
-            # Regex for a sequence of values
-            # We want to capture the whole sequence
-            # The sequence starts after the keyword (and potential units/junk)
-            # It consists of values separated by whitespace
-            # We use \s+ to ensure separation, but the first value might be immediate
-            seq_pattern = f"((?:\\s*(?:{val_pattern}))+)"
-            
-            for keyword in keywords:
-                # Find keyword
-                kw_pattern = f"\\b{re.escape(keyword)}\\b"
-                kw_match = re.search(kw_pattern, search_text, re.IGNORECASE)
-                
-                if kw_match:
-                    post_text = search_text[kw_match.end():]
-                    
-                    # Find the first sequence of values
-                    # We use re.search to find the first sequence
-                    # This will stop when it hits something that is NOT a value (like the next keyword)
-                    seq_match = re.search(seq_pattern, post_text)
-                    
-                    if seq_match:
-                        vals_str = seq_match.group(1)
-                        # Extract individual values from the sequence string
-                        vals = re.findall(val_pattern, vals_str)
-                        
-                        # If we found enough values, take the last 'count' values
-                        if len(vals) >= count:
-                            return vals[-count:]
-                        
-            return [None] * count
-
         count = len(sample_ids)
         
-        oil_hrs = extract_row(['Oil Running Hrs', 'Oil Running Hours'], count)
-        total_hrs = extract_row(['T/R/H of Machinery', 'Total Running Hours'], count)
-        visc_40 = extract_row(['Viscosity@ 40oC', 'Viscosity @ 40oC', 'Viscosity  @ 40oC', 'ViViscosity@ 40oC'], count)
-        visc_100 = extract_row(['Viscosity@ 100oC', 'Viscosity @ 100oC', 'Viscosity  @ 100oC'], count)
-        visc_index = extract_row(['Viscosity Index'], count)
-        tbn = extract_row(['Total Base No.', 'TB No.'], count)
-        water = extract_row(['Water content'], count)
-        flash = extract_row(['Flash Point'], count)
+        rows = {
+            field: extract_row(content, keyword_hits, keywords, count)
+            for field, keywords in FIELD_KEYWORDS.items()
+        }
         
-        fe = extract_row(['Fe', 'Iron'], count)
-        cr = extract_row(['Cr', 'Chromium'], count)
-        si = extract_row(['Si', 'Silicon'], count)
-        al = extract_row(['Al', 'Aluminum'], count)
-        pb = extract_row(['Pb', 'Lead'], count)
-        cu = extract_row(['Cu', 'Copper'], count)
-        sn = extract_row(['Sn', 'Tin'], count)
-        ni = extract_row(['Ni', 'Nickel'], count)
-
-        for i in range(count):
-            record = {
-                'sample_id': sample_ids[i],
-                'oil_hrs': parse_value(oil_hrs[i]),
-                'total_hrs': parse_value(total_hrs[i]),
-                'viscosity_40': parse_value(visc_40[i]),
-                'viscosity_100': parse_value(visc_100[i]),
-                'viscosity_index': parse_value(visc_index[i]),
-                'tbn': parse_value(tbn[i]),
-                'water_content': water[i],
-                'flash_point': parse_value(flash[i]),
-                'fe_ppm': parse_value(fe[i]),
-                'cr_ppm': parse_value(cr[i]),
-                'si_ppm': parse_value(si[i]),
-                'al_ppm': parse_value(al[i]),
-                'pb_ppm': parse_value(pb[i]),
-                'cu_ppm': parse_value(cu[i]),
-                'sn_ppm': parse_value(sn[i]),
-                'ni_ppm': parse_value(ni[i]),
-                'oil_refill_start': 0,
-                'oil_topup': 0,
-                'health_score_lag_1': 0.1,
-                'ml_raw_score': 0.1,
-                'gemini_final_score': 0.1,
-                'status': 'OPTIMAL_CONDITION',
-                'trend': 'STABLE',
-                'recommendation': 'Maintain current operations',
-                'confidence': 'historical',
-                'created_at': created_at_val
-            }
-            categorized_records[category].append(record)
+        # Parse each row of values in one go (water content is kept as text)
+        values = {
+            field: row if field == 'water_content' else [parse_value(v) for v in row]
+            for field, row in rows.items()
+        }
+        # total_hrs is the sort key and a NOT NULL column downstream, so keep it numeric
+        values['total_hrs'] = [parse_hours(v) for v in rows['total_hrs']]
+
+        for sample_id, *row in zip(sample_ids, *values.values()):
+            record = record_template.copy()
+            record['sample_id'] = sample_id
+            record.update(zip(values, row))
+            # Later samples with the same ID replace earlier ones
+            categorized_records[category][sample_id] = record
             
     return categorized_records
 
+def write_records(target_file, records):
+    """Write records as 2-space indented UTF-8 JSON"""
+    if orjson is not None:
+        with open(target_file, 'wb') as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+    else:
+        with open(target_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2, ensure_ascii=False)
+
 def process_file(txt_file, output_map):
     print(f"Processing {txt_file}")
     categorized_records = parse_text_file(txt_file)
     
     if not categorized_records:
         print("No records found!")
-        return
+        return []
 
     # output_map: {'Port': 'file_port.json', 'Stbd': 'file_stbd.json', 'Default': 'file_default.json'}
     
+    # Collect records per output file, so categories that fall back to the
+    # same file are merged instead of overwriting each other
+    records_by_file = {}
     for category, records in categorized_records.items():
         target_file = output_map.get(category)
         if not target_file:
@@ -240,31 +353,57 @@ def process_file(txt_file, output_map):
             
         if target_file:
             print(f"  -> Saving {len(records)} records for category '{category}' to {target_file}")
-            
-            # Sort and ID
-            # Remove duplicates by sample_id
-            unique_records = {}
-            for rec in records:
-                sid = rec.get('sample_id')
-                if sid:
-                    unique_records[sid] = rec
-            records = list(unique_records.values())
-
-            # Sort and ID
-            def get_sort_key(x):
-                val = x.get('total_hrs')
-                if isinstance(val, (int, float)):
-                    return val
-                return 0
-            records.sort(key=get_sort_key)
-            for i, rec in enumerate(records):
-                rec['id'] = i + 1
-                
-            with open(target_file, 'w') as f:
-                json.dump(records, f, indent=4)
+            records_by_file.setdefault(target_file, {}).update(records)
         else:
             print(f"  -> Warning: No output file mapped for category '{category}' with {len(records)} records")
 
+    for target_file, unique_records in records_by_file.items():
+        records = list(unique_records.values())
+
+        # Sort and ID
+        records.sort(key=itemgetter('total_hrs'))
+        for i, rec in enumerate(records):
+            rec['id'] = i + 1
+            
+        write_records(target_file, records)
+
+    return list(records_by_file)
+
+def input_digest(txt_path):
+    """Hash the input text together with this parser's source"""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (__file__, txt_path):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def is_up_to_date(output_map, digest):
+    """True if every mapped output exists and was produced from this exact input and parser"""
+    for target_file in set(output_map.values()):
+        hash_file = target_file + ".hash"
+        if not (os.path.exists(target_file) and os.path.exists(hash_file)):
+            return False
+        with open(hash_file) as f:
+            if f.read().strip() != digest:
+                return False
+    return True
+
+def process_mapping(job):
+    """Process one (input path, output map, force) job; runs in a worker process"""
+    txt_path, output_map, force = job
+    if not os.path.exists(txt_path):
+        return
+
+    digest = input_digest(txt_path)
+    if not force and is_up_to_date(output_map, digest):
+        print(f"Skipping {txt_path} (unchanged)")
+        return
+
+    # Record which input produced each output so unchanged re-runs can be skipped
+    for target_file in process_file(txt_path, output_map):
+        with open(target_file + ".hash", 'w') as f:
+            f.write(digest + "\n")
+
 if __name__ == "__main__":
     base_dir = "temp_text_extracts"
     seed_dir = "lib/seed-data"
@@ -299,7 +438,9 @@ if __name__ == "__main__":
         }
     }
     
-    for txt, output_map in mappings.items():
-        txt_path = os.path.join(base_dir, txt)
-        if os.path.exists(txt_path):
-            process_file(txt_path, output_map)
+    # Input files are independent and parsing is CPU-bound, so use processes
+    # Pass --force to re-parse inputs whose outputs are already up to date
+    force = "--force" in sys.argv[1:]
+    jobs = [(os.path.join(base_dir, txt), output_map, force) for txt, output_map in mappings.items()]
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(process_mapping, jobs))